@@ -1,3 +1,4 @@
+import functools
 import json
 from opentelemetry import trace
 
@@ -5,6 +6,24 @@ tracer = trace.get_tracer(__name__)
 
 DEFAULT_DEPTH = 2
 DEFAULT_ITERATIONS = 4
+PAYLOAD = "x" * 256
+
+
+@functools.lru_cache(maxsize=32)
+def _names(depth: int, iterations: int) -> tuple[str, ...]:
+    """Span names for one level of the tree, built once per (depth, iterations)."""
+    return tuple(f"operation_depth_{depth}_iter_{i}" for i in range(iterations))
+
+
+@functools.lru_cache(maxsize=32)
+def _attributes(depth: int, iterations: int) -> tuple[dict, ...]:
+    """Span attributes for one level of the tree, built once per (depth, iterations).
+
+    The SDK copies attributes into the span, so the cached dicts are never mutated.
+    """
+    return tuple(
+        {"depth": depth, "iteration": i, "payload": PAYLOAD} for i in range(iterations)
+    )
 
 
 def process_level(depth: int, iterations: int) -> None:
@@ -18,9 +37,8 @@ def process_level(depth: int, iterations: int) -> None:
     if depth <= 0:
         return
 
-    for i in range(iterations):
-        with tracer.start_as_current_span(f"operation_depth_{depth}_iter_{i}") as span:
-            span.set_attributes({"depth": depth, "iteration": i, "payload": "x" * 256})
+    for name, attributes in zip(_names(depth, iterations), _attributes(depth, iterations)):
+        with tracer.start_as_current_span(name, attributes=attributes):
             process_level(depth - 1, iterations)
 
 
@@ -53,6 +71,7 @@ def handler(event, lambda_context):
                 "message": "Benchmark complete",
                 "depth": depth,
                 "iterations": iterations,
-            }
+            },
+            separators=(",", ":"),
         ),
     }
@@ -1,5 +1,6 @@
 from lambda_otel_lite import init_telemetry, create_traced_handler
 from otlp_stdout_span_exporter import OTLPStdoutSpanExporter
+import functools
 import json
 
 # Initialize telemetry once at module load time
@@ -7,6 +8,25 @@ tracer, completion_handler = init_telemetry()
 
 DEFAULT_DEPTH = 2
 DEFAULT_ITERATIONS = 4
+PAYLOAD = "x" * 256
+
+
+@functools.lru_cache(maxsize=32)
+def _names(depth: int, iterations: int) -> tuple[str, ...]:
+    """Span names for one level of the tree, built once per (depth, iterations)."""
+    return tuple(f"operation_depth_{depth}_iter_{i}" for i in range(iterations))
+
+
+@functools.lru_cache(maxsize=32)
+def _attributes(depth: int, iterations: int) -> tuple[dict, ...]:
+    """Span attributes for one level of the tree, built once per (depth, iterations).
+
+    The SDK copies attributes into the span, so the cached dicts are never mutated.
+    """
+    return tuple(
+        {"depth": depth, "iteration": i, "payload": PAYLOAD} for i in range(iterations)
+    )
+
 
 def process_level(depth: int, iterations: int) -> None:
     """
@@ -19,13 +39,8 @@ def process_level(depth: int, iterations: int) -> None:
     if depth <= 0:
         return
 
-    for i in range(iterations):
-        with tracer.start_as_current_span(
-            f"operation_depth_{depth}_iter_{i}",
-            set_status_on_exception=True,
-            record_exception=True,
-        ) as span:
-            span.set_attributes({"depth": depth, "iteration": i, "payload": "x" * 256})
+    for name, attributes in zip(_names(depth, iterations), _attributes(depth, iterations)):
+        with tracer.start_as_current_span(name, attributes=attributes):
             process_level(depth - 1, iterations)
 
 
@@ -65,6 +80,7 @@ def handler(event, context):
                 "message": "Benchmark complete",
                 "depth": depth,
                 "iterations": iterations,
-            }
+            },
+            separators=(",", ":"),
         ),
     }
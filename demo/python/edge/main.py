@@ -8,9 +8,11 @@ manipulation, or origin selection.
 For more information on Lambda@Edge, see:
 https://docs.aws.amazon.com/lambda/latest/dg/lambda-edge.html
 """
+from types import MappingProxyType
 from lambda_otel_lite import init_telemetry, create_traced_handler, SpanAttributes, TriggerType, ProcessorMode
 from opentelemetry import trace, propagate
 from opentelemetry.trace import SpanKind
+from opentelemetry.propagators.textmap import Setter
 from opentelemetry.sdk.extension.aws.trace import AwsXRayIdGenerator
 from opentelemetry.propagators.aws import AwsXRayPropagator
 
@@ -23,22 +25,45 @@ tracer, completion_handler = init_telemetry(
     processor_mode=ProcessorMode.ASYNC
 )
 
+# Read-only fallback for missing parts of the CloudFront event
+_EMPTY = MappingProxyType({})
+
+
+class CloudFrontHeaderSetter(Setter[dict]):
+    """Injects trace context straight into a CloudFront headers dict"""
+
+    def set(self, carrier: dict, key: str, value: str) -> None:
+        header_key = key.lower()  # CloudFront expects lowercase header names
+        carrier[header_key] = [{
+            'key': header_key,
+            'value': value
+        }]
+
+
+cloudfront_header_setter = CloudFrontHeaderSetter()
+
+
 # Create a CloudFront event extractor
 def cloudfront_origin_request_extractor(event, context):
     """Extract span attributes from CloudFront origin-request events"""
     attributes = {}
     
     # Add Lambda context attributes
-    if hasattr(context, "aws_request_id"):
-        attributes["faas.invocation_id"] = context.aws_request_id
+    invocation_id = getattr(context, "aws_request_id", None)
+    if invocation_id is not None:
+        attributes["faas.invocation_id"] = invocation_id
     
-    if hasattr(context, "function_name"):
-        attributes["faas.name"] = context.function_name
+    function_name = getattr(context, "function_name", None)
+    if function_name is not None:
+        attributes["faas.name"] = function_name
     
     # Extract CloudFront-specific attributes
-    cf_record = event.get("Records", [{}])[0].get("cf", {})
-    request = cf_record.get("request", {})
-    config = cf_record.get("config", {})
+    try:
+        cf_record = event["Records"][0]["cf"]
+    except (KeyError, IndexError):
+        cf_record = _EMPTY
+    request = cf_record.get("request", _EMPTY)
+    config = cf_record.get("config", _EMPTY)
     
     if config:
         attributes["cloudfront.distribution_id"] = config.get("distributionId", "")
@@ -51,12 +76,12 @@ def cloudfront_origin_request_extractor(event, context):
         attributes["http.url"] = request.get("uri", "")
         
         # Extract headers with proper handling of CloudFront header structure
-        headers = request.get("headers", {})
+        headers = request.get("headers", _EMPTY)
         if "user-agent" in headers and headers["user-agent"]:
             attributes["http.user_agent"] = headers["user-agent"][0].get("value", "")
             
         # Extract origin information
-        origin = request.get("origin", {}).get("custom", {})
+        origin = request.get("origin", _EMPTY).get("custom", _EMPTY)
         if origin:
             attributes["origin.domain_name"] = origin.get("domainName", "")
             attributes["origin.protocol"] = origin.get("protocol", "")
@@ -122,16 +147,7 @@ def handler(event, context):
         request['headers'] = {}
         
     # Inject trace context into headers to be sent to the origin via CloudFront
-    carrier = {}
-    propagate.inject(carrier)
-    
-    # Convert to CloudFront header format and add to request
-    for key, value in carrier.items():
-        header_key = key.lower()  # CloudFront expects lowercase header names
-        request['headers'][header_key] = [{
-            'key': header_key,
-            'value': value
-        }]
+    propagate.inject(request['headers'], setter=cloudfront_header_setter)
     
     current_span.add_event(
         name="edge.forwarding",
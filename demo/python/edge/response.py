@@ -8,6 +8,7 @@ for response transformation, header manipulation, or error handling.
 For more information on Lambda@Edge, see:
 https://docs.aws.amazon.com/lambda/latest/dg/lambda-edge.html
 """
+from types import MappingProxyType
 from lambda_otel_lite import init_telemetry, create_traced_handler, SpanAttributes, TriggerType, ProcessorMode
 from opentelemetry import trace, propagate
 from opentelemetry.trace import SpanKind
@@ -23,6 +24,19 @@ tracer, completion_handler = init_telemetry(
     processor_mode=ProcessorMode.ASYNC
 )
 
+# Read-only fallback for missing parts of the CloudFront event
+_EMPTY = MappingProxyType({})
+
+# CloudFront header names (lowercase) recorded as span attributes
+_REQUEST_HEADER_ATTRIBUTES = {
+    "user-agent": "http.user_agent",
+    "cache-control": "http.request.cache_control",
+}
+_RESPONSE_HEADER_ATTRIBUTES = {
+    "content-type": "http.response.content_type",
+    "content-length": "http.response.content_length",
+}
+
 # Create a CloudFront origin response event extractor
 def cloudfront_origin_response_extractor(event, context):
     """Extract span attributes from CloudFront origin-response events"""
@@ -30,17 +44,22 @@ def cloudfront_origin_response_extractor(event, context):
     carrier = None
     
     # Add Lambda context attributes
-    if hasattr(context, "aws_request_id"):
-        attributes["faas.invocation_id"] = context.aws_request_id
+    invocation_id = getattr(context, "aws_request_id", None)
+    if invocation_id is not None:
+        attributes["faas.invocation_id"] = invocation_id
     
-    if hasattr(context, "function_name"):
-        attributes["faas.name"] = context.function_name
+    function_name = getattr(context, "function_name", None)
+    if function_name is not None:
+        attributes["faas.name"] = function_name
     
     # Extract CloudFront-specific attributes
-    cf_record = event.get("Records", [{}])[0].get("cf", {})
-    response = cf_record.get("response", {})
-    request = cf_record.get("request", {})
-    config = cf_record.get("config", {})
+    try:
+        cf_record = event["Records"][0]["cf"]
+    except (KeyError, IndexError):
+        cf_record = _EMPTY
+    response = cf_record.get("response", _EMPTY)
+    request = cf_record.get("request", _EMPTY)
+    config = cf_record.get("config", _EMPTY)
     
     # Extract trace context from response headers if present
     # This will allow the tracer to create a proper parent-child relationship
@@ -62,22 +81,20 @@ def cloudfront_origin_response_extractor(event, context):
         attributes["http.client_ip"] = request.get("clientIp", "")
         
         # Extract key request headers
-        request_headers = request.get("headers", {})
-        if "user-agent" in request_headers:
-            attributes["http.user_agent"] = request_headers["user-agent"][0].get("value", "")
-        if "cache-control" in request_headers:
-            attributes["http.request.cache_control"] = request_headers["cache-control"][0].get("value", "")
+        request_headers = request.get("headers", _EMPTY)
+        for header, attribute in _REQUEST_HEADER_ATTRIBUTES.items():
+            if values := request_headers.get(header):
+                attributes[attribute] = values[0].get("value", "")
         
     if response:
         attributes["http.status_code"] = response.get("status", "")
         attributes["http.status_description"] = response.get("statusDescription", "")
         
         # Extract key response headers
-        response_headers = response.get("headers", {})
-        if "content-type" in response_headers:
-            attributes["http.response.content_type"] = response_headers["content-type"][0].get("value", "")
-        if "content-length" in response_headers:
-            attributes["http.response.content_length"] = response_headers["content-length"][0].get("value", "")
+        response_headers = response.get("headers", _EMPTY)
+        for header, attribute in _RESPONSE_HEADER_ATTRIBUTES.items():
+            if values := response_headers.get(header):
+                attributes[attribute] = values[0].get("value", "")
     
     # Return span attributes with the carrier for proper parent-child relationship
     return SpanAttributes(
@@ -1,6 +1,9 @@
+import contextvars
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor, wait
+import orjson
 from requests import Session
+from requests.adapters import HTTPAdapter
 from lambda_otel_lite import init_telemetry, create_traced_handler
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
 from opentelemetry import trace
@@ -18,9 +21,23 @@ tracer, completion_handler = init_telemetry()
 # Instrument requests library
 RequestsInstrumentor().instrument()
 
-
+# Messages in a batch are independent, so they are saved concurrently.
+# The default matches the SQS event source BatchSize of 10.
+try:
+    worker_threads = max(1, int(os.environ.get("SQS_WORKER_THREADS", "10")))
+except ValueError:
+    logger.warning("Invalid SQS_WORKER_THREADS value, using 10 worker threads")
+    worker_threads = 10
+executor = ThreadPoolExecutor(max_workers=worker_threads)
+
+# Keep one pooled keep-alive connection per worker so concurrent saves
+# don't discard connections and pay for a new TLS handshake
 http_session = Session()
+http_session.mount("https://", HTTPAdapter(pool_maxsize=worker_threads))
+http_session.mount("http://", HTTPAdapter(pool_maxsize=worker_threads))
 target_url = os.environ.get("TARGET_URL")
+# requests merges these into each request's own headers, so one dict is shared
+json_headers = {"content-type": "application/json"}
 
 
 @tracer.start_as_current_span("processor.save-quote")
@@ -28,30 +45,25 @@ def save_quote(quote: dict):
     """
     Save a quote to the backend service.
     """
-    span_event(
-        name="demo.processor.saving-quote",
-        body=f"Saving quote {quote.get('id')} to backend service at {target_url}",
-        level=Level.INFO,
-        attrs={
-            "demo.quote.id": quote.get("id"),
+    quote_id = quote.get("id")
+    trace.get_current_span().set_attributes(
+        {
+            "demo.quote.id": quote_id,
             "demo.quote.text": quote.get("quote"),
             "demo.quote.author": quote.get("author"),
-        },
-
+        }
     )
     response = http_session.post(
         target_url,
-        json=quote,
-        headers={
-            "content-type": "application/json",
-        },
+        data=orjson.dumps(quote),
+        headers=json_headers,
     )
 
     response.raise_for_status()
 
     span_event(
         name="demo.processor.saved-quote",
-        body=f"Successfully saved quote {quote.get('id')} to backend with status code {response.status_code}",
+        body=f"Successfully saved quote {quote_id} to backend with status code {response.status_code}",
         level=Level.INFO,
         attrs={
             "http.status_code": str(response.status_code),
@@ -61,6 +73,42 @@ def save_quote(quote: dict):
     return response.json()
 
 
+def process_message(message: dict):
+    """
+    Process a single SQS message within its own consumer span.
+
+    Args:
+        message: SQS record containing a quote in its body
+
+    Returns:
+        dict: Response from the backend service
+    """
+    # Use a context manager to handle the span
+    # It handles link extraction, span creation, attribute setting, and ending the span
+    with start_sqs_message_span(tracer, message) as processing_span:
+        quote = orjson.loads(message["body"])
+        quote_id = quote.get("id", "")
+        processing_span.set_attribute("quote.id", str(quote_id))
+        processing_span.set_attribute("quote.author", quote.get("author", ""))
+        # Set a short preview of the quote text (first 50 chars)
+        quote_text = quote.get("quote", "")
+        if quote_text:
+            preview = (quote_text[:47] + "...") if len(quote_text) > 50 else quote_text
+            processing_span.set_attribute("quote.text.preview", preview)
+
+        # Save the quote within the body span's context
+        try:
+            return save_quote(quote)
+        except Exception as e:
+            span_event(
+                name="demo.processor.error-saving-quote",
+                body=f"Error saving quote {quote_id}: {str(e)}",
+                level=Level.ERROR,
+                span=processing_span,
+            )
+            raise
+
+
 # Create the traced handler (using default extractor)
 traced_handler = create_traced_handler(
     "sqs-processor",
@@ -75,7 +123,8 @@ def lambda_handler(event, lambda_context):
     """
     Lambda handler that processes SQS events containing quotes.
     Creates a parent span for the batch and individual child spans for each message,
-    using the sqs_tracing module for per-message span management.
+    using the sqs_tracing module for per-message span management. Messages are
+    processed concurrently on a thread pool.
 
     Args:
         event: Lambda event containing SQS records
@@ -84,51 +133,22 @@ def lambda_handler(event, lambda_context):
     Returns:
         dict: Response with status code 200 and processing results
     """
-    batch_size = len(event.get("Records", []))
-    span_event(
-        name="demo.processor.started-processing-quotes",
-        body=f"Started processing {batch_size} SQS messages",
-        level=Level.INFO,
-        attrs={
-            "demo.quotes.batch_size": batch_size, # Use calculated batch_size
-        },
-    )
-
-    results = []
-    for index, message in enumerate(event.get("Records", [])):
-        if message_body := message.get("body"):
-            # Use a context manager to handle the span
-            # It handles link extraction, span creation, attribute setting, and ending the span
-            with start_sqs_message_span(tracer, message) as processing_span:
-                quote = json.loads(message_body)
-                span_event(
-                    name="demo.processor.processing-quote",
-                    body=f"Processing quote with id: {quote.get('id')} ({index+1} of {batch_size})",
-                    level=Level.INFO,
-                )
-                processing_span.set_attribute("quote.id", str(quote.get("id", "")))
-                processing_span.set_attribute("quote.author", quote.get("author", ""))
-                # Set a short preview of the quote text (first 50 chars)
-                quote_text = quote.get("quote", "")
-                if quote_text:
-                    preview = (quote_text[:47] + "...") if len(quote_text) > 50 else quote_text
-                    processing_span.set_attribute("quote.text.preview", preview)
-
-                # Save the quote within the body span's context
-                try:
-                    result = save_quote(quote)
-                    results.append(result)
-                except Exception as e:
-                    span_event(
-                        name="demo.processor.error-saving-quote",
-                        body=f"Error saving quote {quote.get('id')}: {str(e)}",
-                        level=Level.ERROR,
-                    )
-                    raise
+    # The batch size is already recorded on the batch span as messaging.batch.message_count
+    # Each task runs in a copy of the current context, so its span is a child of the batch span
+    futures = [
+        executor.submit(contextvars.copy_context().run, process_message, message)
+        for message in event.get("Records", [])
+        if message.get("body")
+    ]
+    # Let every message finish before surfacing the first failure
+    wait(futures)
+    for future in futures:
+        # Only the count is reported, so the backend responses are not kept
+        future.result()
 
     return {
         "statusCode": 200,
-        "body": json.dumps(
-            {"message": "Quote processing complete", "processed": len(results)}
-        ),
+        "body": orjson.dumps(
+            {"message": "Quote processing complete", "processed": len(futures)}
+        ).decode(),
     }
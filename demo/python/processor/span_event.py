@@ -2,14 +2,18 @@
 from __future__ import annotations
 import os
 from enum import IntEnum
-from datetime import datetime
+from time import time_ns
 from typing import Mapping, Any
 from opentelemetry import trace
 
 class Level(IntEnum):
     TRACE = 1; DEBUG = 5; INFO = 9; WARN = 13; ERROR = 17
 
-_LEVEL_TEXT = {l: l.name for l in Level}
+# Severity attributes are fixed per level, so build them once
+_LEVEL_ATTRS = {
+    l: {"event.severity_text": l.name, "event.severity_number": int(l)}
+    for l in Level
+}
 
 def _env_min_level() -> Level:
     value = os.getenv("EVENTS_LOG_LEVEL", "INFO").upper()
@@ -33,13 +37,9 @@ def span_event(
     if not span.is_recording():
         return
 
-    span.add_event(
-        name,
-        {
-            "event.severity_text": _LEVEL_TEXT[level],
-            "event.severity_number": int(level),
-            "event.body": body,
-            **(attrs or {}),
-        },
-        ts_ns or int(datetime.utcnow().timestamp() * 1e9),
-    )
+    event_attrs = _LEVEL_ATTRS[level].copy()
+    event_attrs["event.body"] = body
+    if attrs:
+        event_attrs.update(attrs)
+
+    span.add_event(name, event_attrs, ts_ns or time_ns())
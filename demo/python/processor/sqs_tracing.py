@@ -43,33 +43,39 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# The propagator is stateless, so one instance serves every record
+xray_propagator = AwsXRayPropagator()
+
 def sqs_event_extractor(event, context):
     """Extract span attributes from SQS events"""
     
     base = default_extractor(event, context)
-    attributes = base.attributes.copy()
-    
-    
-    # Add SQS specific attributes
-    
+
+    # Without records there is no queue to describe (e.g. test invokes)
     records = event.get("Records")
+    if not records:
+        return base
+
+    # Add SQS specific attributes
     queue_arn = records[0]["eventSourceARN"]
-    queue_name = queue_arn.split(":")[-1]
-    attributes["messaging.destination.name"] = queue_name
+    queue_name = queue_arn.rsplit(":", 1)[-1]
+
+    attributes = base.attributes.copy()
+    attributes.update({
+        "faas.trigger": "pubsub",
+        "messaging.system": "aws_sqs",
+        "messaging.operation.name": "process",
+        "messaging.operation.type": "process",
+        "messaging.batch.message_count": len(records),
+        "messaging.destination.name": queue_name,
+        "messaging.destination.kind": "queue"
+    })
     
     return SpanAttributes(
         trigger=TriggerType.PUBSUB,
         kind=SpanKind.CONSUMER,
         span_name=f"{queue_name} process",
-        attributes=base.attributes.copy() | {
-            "faas.trigger": "pubsub",
-            "messaging.system": "aws_sqs",
-            "messaging.operation.name": "process",
-            "messaging.operation.type": "process",
-            "messaging.batch.message_count": len(records),
-            "messaging.destination.name": queue_name,
-            "messaging.destination.kind": "queue"
-        },
+        attributes=attributes,
         carrier={
             "X-Amzn-Trace-Id": os.environ.get("_X_AMZN_TRACE_ID")
         }
@@ -88,9 +94,10 @@ def extract_links_from_sqs_record(record: dict) -> List[Link]:
         List of valid span links extracted from the record
     """
     links = []
-    xray_propagator = AwsXRayPropagator()
 
-    if message_attributes := record.get("messageAttributes"):
+    message_attributes = record.get("messageAttributes")
+    # Only run the propagators when the message carries one of their fields
+    if message_attributes and message_attributes.keys() & propagate.get_global_textmap().fields:
         try:
             # Extract context using the w3c library's getter
             carrier_ctx = propagate.extract(message_attributes, getter=boto3sqs_getter)
@@ -105,7 +112,8 @@ def extract_links_from_sqs_record(record: dict) -> List[Link]:
             logger.warning(f"Failed to extract trace context from message attributes: {e}")
 
     # Then check system attributes (AWS X-Ray propagation)
-    if trace_header := record.get("attributes", {}).get("AWSTraceHeader"):
+    system_attributes = record.get("attributes")
+    if system_attributes and (trace_header := system_attributes.get("AWSTraceHeader")):
         try:
             # Create carrier with the X-Ray trace header
             carrier = {"X-Amzn-Trace-Id": trace_header}
@@ -142,9 +150,9 @@ def start_sqs_message_span(tracer: Tracer, record: dict) -> Iterator[Span]:
     links = extract_links_from_sqs_record(record)
     # derive queue name for messaging.destination attributes
     queue_arn = record.get("eventSourceARN")
-    queue_name = queue_arn.split(":")[-1] if queue_arn else None
+    queue_name = queue_arn.rsplit(":", 1)[-1] if queue_arn else None
 
-    span = tracer.start_span(
+    with tracer.start_as_current_span(
         f"{queue_name} process",
         kind=SpanKind.CONSUMER,
         links=links,
@@ -157,15 +165,7 @@ def start_sqs_message_span(tracer: Tracer, record: dict) -> Iterator[Span]:
             "messaging.destination.name": queue_name,
             "messaging.destination.kind": "queue"
         }
-    )
-    # We manually create the span, activate it using trace.use_span
-    # only during the yield, and manually end it in `finally`.
-    # This is because this function is a context manager itself. 
-    # Using `tracer.start_as_current_span` would end the span 
-    # immediately after the `yield`, which is too early.
-    try:
-        with trace.use_span(span, end_on_exit=False):
-            yield span
-    finally:
-        span.end()
-
+    ) as span:
+        # The span stays current for the caller's `with` block and ends when
+        # it exits, since the generator resumes only at that point.
+        yield span
@@ -39,7 +39,7 @@ def init_telemetry(
             "faas.name": lambda_context.function_name,
             "faas.version": lambda_context.function_version,
             "aws.region": os.environ.get("AWS_REGION"),
-            "cloud.account.id": lambda_context.invoked_function_arn.split(":")[4],
+            "cloud.account.id": lambda_context.invoked_function_arn.split(":", 5)[4],
             "faas.max_memory": os.environ.get("AWS_LAMBDA_FUNCTION_MEMORY_SIZE"),
             "faas.runtime": "python",
         }
@@ -53,13 +53,25 @@ def init_telemetry(
         timeout=5,  # 5 seconds timeout for Lambda environment
     )
 
-    # Use BatchSpanProcessor with Lambda-optimized settings
+    # Use BatchSpanProcessor with Lambda-optimized settings. An invocation
+    # produces a handful of spans and is flushed at the end anyway, so the
+    # queue is kept small. Settings whose standard OTEL_BSP_* variables are
+    # set are left to the SDK, which parses and validates them. The queue and
+    # batch sizes depend on each other, so they are handed over together.
+    env_sizes = (
+        "OTEL_BSP_MAX_QUEUE_SIZE" in os.environ
+        or "OTEL_BSP_MAX_EXPORT_BATCH_SIZE" in os.environ
+    )
+    schedule_delay_millis = None if "OTEL_BSP_SCHEDULE_DELAY" in os.environ else 1000
+    max_queue_size = None if env_sizes else 256
+    max_export_batch_size = None if env_sizes else 64
+
     provider.add_span_processor(
         BatchSpanProcessor(
             otlp_exporter,
-            schedule_delay_millis=1000,  # More frequent exports for Lambda
-            max_export_batch_size=512,
-            max_queue_size=2048,
+            schedule_delay_millis=schedule_delay_millis,  # More frequent exports for Lambda
+            max_export_batch_size=max_export_batch_size,
+            max_queue_size=max_queue_size,
         )
     )
 
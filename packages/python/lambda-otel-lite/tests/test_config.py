@@ -1,236 +1,127 @@
 """Tests for the config module."""
 
-import os
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from lambda_otel_lite.config import get_bool_env, get_int_env, get_str_env
 
-
-@pytest.fixture
-def clean_env():
+BOOL_CASES = [
+    ("true", (), True),
+    ("false", (), False),
+    # Case-insensitive values
+    ("TRUE", (), True),
+    ("False", (), False),
+    # Config value when the environment variable is not set
+    (None, (True,), True),
+    (None, (False,), False),
+    # Default value when neither env var nor config is set
+    (None, (), False),
+    (None, (None, True), True),
+    # Config value when the env var is empty
+    ("", (True,), True),
+    ("", (), False),
+    # Surrounding whitespace is ignored
+    ("  true  ", (), True),
+]
+
+INT_CASES = [
+    ("123", (), 123),
+    ("0", (), 0),
+    ("-456", (), -456),
+    # Config value when the environment variable is not set
+    (None, (42,), 42),
+    # Default value when neither env var nor config is set
+    (None, (), 0),
+    (None, (None, 42), 42),
+    # Config value when the env var is empty
+    ("", (42,), 42),
+    ("", (), 0),
+    # Surrounding whitespace is ignored
+    ("  123  ", (), 123),
+]
+
+STR_CASES = [
+    ("hello", (), "hello"),
+    # Config value when the environment variable is not set
+    (None, ("world",), "world"),
+    # Default value when neither env var nor config is set
+    (None, (), ""),
+    (None, (None, "default"), "default"),
+    # Config value when the env var is empty
+    ("", ("world",), "world"),
+    ("", (), ""),
+    # Surrounding whitespace is stripped
+    ("  hello  ", (), "hello"),
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
     """Fixture to clean environment variables before each test."""
     # Clear any environment variables that might affect the tests
-    if "TEST_BOOL" in os.environ:
-        del os.environ["TEST_BOOL"]
-    if "TEST_INT" in os.environ:
-        del os.environ["TEST_INT"]
-    if "TEST_STR" in os.environ:
-        del os.environ["TEST_STR"]
-    yield
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_true(mock_create_logger, clean_env):
-    """Test that get_bool_env returns True when the environment variable is 'true'."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_BOOL"] = "true"
-    assert get_bool_env("TEST_BOOL") is True
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_false(mock_create_logger, clean_env):
-    """Test that get_bool_env returns False when the environment variable is 'false'."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_BOOL"] = "false"
-    assert get_bool_env("TEST_BOOL") is False
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_case_insensitive(mock_create_logger, clean_env):
-    """Test that get_bool_env handles case-insensitive values."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_BOOL"] = "TRUE"
-    assert get_bool_env("TEST_BOOL") is True
-
-    os.environ["TEST_BOOL"] = "False"
-    assert get_bool_env("TEST_BOOL") is False
-
+    for name in ("TEST_BOOL", "TEST_INT", "TEST_STR"):
+        monkeypatch.delenv(name, raising=False)
 
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_config_value(mock_create_logger, clean_env):
-    """Test that get_bool_env returns the config value when the environment variable is not set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert get_bool_env("TEST_BOOL", True) is True
-    assert get_bool_env("TEST_BOOL", False) is False
 
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """Replace the config module logger so warnings can be asserted on."""
+    logger = MagicMock()
+    monkeypatch.setattr("lambda_otel_lite.config.logger", logger)
+    return logger
 
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_default(mock_create_logger, clean_env):
-    """Test that get_bool_env returns the default value when neither env var nor config is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
 
-    assert get_bool_env("TEST_BOOL") is False  # Default is False
-    assert get_bool_env("TEST_BOOL", None, True) is True
+@pytest.mark.parametrize("env_value, args, expected", BOOL_CASES)
+def test_get_bool_env(monkeypatch, env_value, args, expected):
+    """Test that get_bool_env resolves env var, then config value, then default."""
+    if env_value is not None:
+        monkeypatch.setenv("TEST_BOOL", env_value)
+    assert get_bool_env("TEST_BOOL", *args) is expected
 
 
-@patch("lambda_otel_lite.config.logger")
-def test_get_bool_env_with_invalid_value(mock_logger, clean_env):
+def test_get_bool_env_with_invalid_value(mock_logger, monkeypatch):
     """Test that get_bool_env logs a warning and returns the config value when the env var is invalid."""
-    os.environ["TEST_BOOL"] = "invalid"
+    monkeypatch.setenv("TEST_BOOL", "invalid")
     assert get_bool_env("TEST_BOOL", True) is True
     assert get_bool_env("TEST_BOOL") is False
     mock_logger.warn.assert_called()
 
 
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_empty_value(mock_create_logger, clean_env):
-    """Test that get_bool_env returns the config value when the env var is empty."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_BOOL"] = ""
-    assert get_bool_env("TEST_BOOL", True) is True
-    assert get_bool_env("TEST_BOOL") is False
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_bool_env_with_whitespace(mock_create_logger, clean_env):
-    """Test that get_bool_env handles whitespace in the environment variable."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_BOOL"] = "  true  "
-    assert get_bool_env("TEST_BOOL") is True
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_int_env_with_valid_value(mock_create_logger, clean_env):
-    """Test that get_int_env returns the correct value when the environment variable is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_INT"] = "123"
-    assert get_int_env("TEST_INT") == 123
-
-    os.environ["TEST_INT"] = "0"
-    assert get_int_env("TEST_INT") == 0
-
-    os.environ["TEST_INT"] = "-456"
-    assert get_int_env("TEST_INT") == -456
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_int_env_with_config_value(mock_create_logger, clean_env):
-    """Test that get_int_env returns the config value when the environment variable is not set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert get_int_env("TEST_INT", 42) == 42
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_int_env_with_default(mock_create_logger, clean_env):
-    """Test that get_int_env returns the default value when neither env var nor config is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert get_int_env("TEST_INT") == 0  # Default is 0
-    assert get_int_env("TEST_INT", None, 42) == 42
+@pytest.mark.parametrize("env_value, args, expected", INT_CASES)
+def test_get_int_env(monkeypatch, env_value, args, expected):
+    """Test that get_int_env resolves env var, then config value, then default."""
+    if env_value is not None:
+        monkeypatch.setenv("TEST_INT", env_value)
+    assert get_int_env("TEST_INT", *args) == expected
 
 
-@patch("lambda_otel_lite.config.logger")
-def test_get_int_env_with_invalid_value(mock_logger, clean_env):
+def test_get_int_env_with_invalid_value(mock_logger, monkeypatch):
     """Test that get_int_env logs a warning and returns the config value when the env var is invalid."""
-    os.environ["TEST_INT"] = "invalid"
+    monkeypatch.setenv("TEST_INT", "invalid")
     assert get_int_env("TEST_INT", 42) == 42
     assert get_int_env("TEST_INT") == 0
     mock_logger.warn.assert_called()
 
 
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_int_env_with_empty_value(mock_create_logger, clean_env):
-    """Test that get_int_env returns the config value when the env var is empty."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_INT"] = ""
-    assert get_int_env("TEST_INT", 42) == 42
-    assert get_int_env("TEST_INT") == 0
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_int_env_with_whitespace(mock_create_logger, clean_env):
-    """Test that get_int_env handles whitespace in the environment variable."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_INT"] = "  123  "
-    assert get_int_env("TEST_INT") == 123
-
-
-@patch("lambda_otel_lite.config.logger")
-def test_get_int_env_with_validator(mock_logger, clean_env):
+def test_get_int_env_with_validator(mock_logger, monkeypatch):
     """Test that get_int_env applies the validator function if provided."""
-    os.environ["TEST_INT"] = "123"
+    monkeypatch.setenv("TEST_INT", "123")
     assert get_int_env("TEST_INT", 42, 0, lambda x: x > 100) == 123
     assert get_int_env("TEST_INT", 42, 0, lambda x: x > 200) == 42
     mock_logger.warn.assert_called_once()
 
 
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_str_env_with_valid_value(mock_create_logger, clean_env):
-    """Test that get_str_env returns the correct value when the environment variable is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_STR"] = "hello"
-    assert get_str_env("TEST_STR") == "hello"
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_str_env_with_config_value(mock_create_logger, clean_env):
-    """Test that get_str_env returns the config value when the environment variable is not set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert get_str_env("TEST_STR", "world") == "world"
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_str_env_with_default(mock_create_logger, clean_env):
-    """Test that get_str_env returns the default value when neither env var nor config is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert get_str_env("TEST_STR") == ""  # Default is empty string
-    assert get_str_env("TEST_STR", None, "default") == "default"
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_str_env_with_empty_value(mock_create_logger, clean_env):
-    """Test that get_str_env returns the config value when the env var is empty."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_STR"] = ""
-    assert get_str_env("TEST_STR", "world") == "world"
-    assert get_str_env("TEST_STR") == ""
-
-
-@patch("lambda_otel_lite.config.create_logger")
-def test_get_str_env_with_whitespace(mock_create_logger, clean_env):
-    """Test that get_str_env handles whitespace in the environment variable."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["TEST_STR"] = "  hello  "
-    assert get_str_env("TEST_STR") == "hello"
+@pytest.mark.parametrize("env_value, args, expected", STR_CASES)
+def test_get_str_env(monkeypatch, env_value, args, expected):
+    """Test that get_str_env resolves env var, then config value, then default."""
+    if env_value is not None:
+        monkeypatch.setenv("TEST_STR", env_value)
+    assert get_str_env("TEST_STR", *args) == expected
 
 
-@patch("lambda_otel_lite.config.logger")
-def test_get_str_env_with_validator(mock_logger, clean_env):
+def test_get_str_env_with_validator(mock_logger, monkeypatch):
     """Test that get_str_env applies the validator function if provided."""
-    os.environ["TEST_STR"] = "hello"
+    monkeypatch.setenv("TEST_STR", "hello")
     assert get_str_env("TEST_STR", "world", "", lambda x: len(x) > 3) == "hello"
     assert get_str_env("TEST_STR", "world", "", lambda x: len(x) > 5) == "world"
     mock_logger.warn.assert_called_once()
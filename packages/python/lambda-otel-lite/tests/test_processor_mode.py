@@ -1,24 +1,59 @@
 """Tests for the ProcessorMode enum and its methods."""
 
-import os
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from lambda_otel_lite import ProcessorMode
 from lambda_otel_lite.constants import EnvVars
 
-
-@pytest.fixture
-def clean_env():
+FROM_ENV_CASES = [
+    ("sync", (), ProcessorMode.SYNC),
+    ("async", (), ProcessorMode.ASYNC),
+    ("finalize", (), ProcessorMode.FINALIZE),
+    # Case-insensitive values
+    ("SYNC", (), ProcessorMode.SYNC),
+    ("Async", (), ProcessorMode.ASYNC),
+    # Default value when the environment variable is not set
+    (None, (ProcessorMode.SYNC,), ProcessorMode.SYNC),
+    (None, (ProcessorMode.ASYNC,), ProcessorMode.ASYNC),
+    # Default value when the environment variable is empty
+    ("", (ProcessorMode.SYNC,), ProcessorMode.SYNC),
+    # Surrounding whitespace is ignored
+    ("  sync  ", (), ProcessorMode.SYNC),
+]
+
+RESOLVE_CASES = [
+    # Environment variable takes precedence over the config value
+    ("async", (), ProcessorMode.ASYNC),
+    ("async", (ProcessorMode.SYNC,), ProcessorMode.ASYNC),
+    # Config value when the environment variable is not set
+    (None, (ProcessorMode.ASYNC,), ProcessorMode.ASYNC),
+    (None, (ProcessorMode.FINALIZE,), ProcessorMode.FINALIZE),
+    # Default value when neither env var nor config is set
+    (None, (), ProcessorMode.SYNC),
+    # Config value when the environment variable is empty
+    ("", (ProcessorMode.ASYNC,), ProcessorMode.ASYNC),
+    ("", (), ProcessorMode.SYNC),
+    # Whitespace and case are normalized
+    ("  async  ", (), ProcessorMode.ASYNC),
+    ("ASYNC", (), ProcessorMode.ASYNC),
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
     """Fixture to clean environment variables before each test."""
     # Clear any environment variables that might affect the tests
-    if EnvVars.PROCESSOR_MODE in os.environ:
-        del os.environ[EnvVars.PROCESSOR_MODE]
-    if "TEST_MODE" in os.environ:
-        del os.environ["TEST_MODE"]
-    if "CUSTOM_ENV_VAR" in os.environ:
-        del os.environ["CUSTOM_ENV_VAR"]
-    yield
+    for name in (EnvVars.PROCESSOR_MODE, "TEST_MODE", "CUSTOM_ENV_VAR"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """Replace the logger that resolve creates so warnings can be asserted on."""
+    logger = MagicMock()
+    monkeypatch.setattr("lambda_otel_lite.logger.create_logger", lambda *_: logger)
+    return logger
 
 
 def test_enum_values():
@@ -28,134 +63,40 @@ def test_enum_values():
     assert ProcessorMode.FINALIZE == "finalize"
 
 
-def test_from_env_with_valid_value(clean_env):
-    """Test that from_env returns the correct value when the environment variable is set."""
-    os.environ["TEST_MODE"] = "sync"
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.SYNC
-
-    os.environ["TEST_MODE"] = "async"
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.ASYNC
-
-    os.environ["TEST_MODE"] = "finalize"
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.FINALIZE
+@pytest.mark.parametrize("env_value, args, expected", FROM_ENV_CASES)
+def test_from_env(monkeypatch, env_value, args, expected):
+    """Test that from_env reads the environment variable, falling back to the default."""
+    if env_value is not None:
+        monkeypatch.setenv("TEST_MODE", env_value)
+    assert ProcessorMode.from_env("TEST_MODE", *args) == expected
 
 
-def test_from_env_with_case_insensitive_value(clean_env):
-    """Test that from_env handles case-insensitive values."""
-    os.environ["TEST_MODE"] = "SYNC"
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.SYNC
-
-    os.environ["TEST_MODE"] = "Async"
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.ASYNC
-
-
-def test_from_env_with_default(clean_env):
-    """Test that from_env returns the default value when the environment variable is not set."""
-    assert ProcessorMode.from_env("TEST_MODE", ProcessorMode.SYNC) == ProcessorMode.SYNC
-    assert (
-        ProcessorMode.from_env("TEST_MODE", ProcessorMode.ASYNC) == ProcessorMode.ASYNC
-    )
-
-
-def test_from_env_with_invalid_value(clean_env):
+def test_from_env_with_invalid_value(monkeypatch):
     """Test that from_env raises ValueError when the environment variable has an invalid value."""
-    os.environ["TEST_MODE"] = "invalid"
+    monkeypatch.setenv("TEST_MODE", "invalid")
     with pytest.raises(ValueError):
         ProcessorMode.from_env("TEST_MODE")
 
 
-def test_from_env_with_empty_value(clean_env):
-    """Test that from_env returns the default value when the environment variable is empty."""
-    os.environ["TEST_MODE"] = ""
-    assert ProcessorMode.from_env("TEST_MODE", ProcessorMode.SYNC) == ProcessorMode.SYNC
-
-
-def test_from_env_with_whitespace(clean_env):
-    """Test that from_env handles whitespace in the environment variable."""
-    os.environ["TEST_MODE"] = "  sync  "
-    assert ProcessorMode.from_env("TEST_MODE") == ProcessorMode.SYNC
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_env_var(mock_create_logger, clean_env):
-    """Test that resolve returns the environment variable value when it's set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ[EnvVars.PROCESSOR_MODE] = "async"
-    assert ProcessorMode.resolve() == ProcessorMode.ASYNC
-    assert ProcessorMode.resolve(ProcessorMode.SYNC) == ProcessorMode.ASYNC
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_config_value(mock_create_logger, clean_env):
-    """Test that resolve returns the config value when the environment variable is not set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
+@pytest.mark.parametrize("env_value, args, expected", RESOLVE_CASES)
+def test_resolve(monkeypatch, env_value, args, expected):
+    """Test that resolve prefers the env var, then the config value, then SYNC."""
+    if env_value is not None:
+        monkeypatch.setenv(EnvVars.PROCESSOR_MODE, env_value)
+    assert ProcessorMode.resolve(*args) == expected
 
-    assert ProcessorMode.resolve(ProcessorMode.ASYNC) == ProcessorMode.ASYNC
-    assert ProcessorMode.resolve(ProcessorMode.FINALIZE) == ProcessorMode.FINALIZE
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_default(mock_create_logger, clean_env):
-    """Test that resolve returns the default value when neither env var nor config is set."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    assert ProcessorMode.resolve() == ProcessorMode.SYNC
 
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_invalid_env_var(mock_create_logger, clean_env):
+def test_resolve_with_invalid_env_var(mock_logger, monkeypatch):
     """Test that resolve logs a warning and returns the config value when the env var is invalid."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ[EnvVars.PROCESSOR_MODE] = "invalid"
+    monkeypatch.setenv(EnvVars.PROCESSOR_MODE, "invalid")
     assert ProcessorMode.resolve(ProcessorMode.ASYNC) == ProcessorMode.ASYNC
     assert ProcessorMode.resolve() == ProcessorMode.SYNC
     mock_logger.warn.assert_called()
 
 
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_empty_env_var(mock_create_logger, clean_env):
-    """Test that resolve returns the config value when the env var is empty."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ[EnvVars.PROCESSOR_MODE] = ""
-    assert ProcessorMode.resolve(ProcessorMode.ASYNC) == ProcessorMode.ASYNC
-    assert ProcessorMode.resolve() == ProcessorMode.SYNC
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_whitespace_env_var(mock_create_logger, clean_env):
-    """Test that resolve handles whitespace in the environment variable."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ[EnvVars.PROCESSOR_MODE] = "  async  "
-    assert ProcessorMode.resolve() == ProcessorMode.ASYNC
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_case_insensitive_env_var(mock_create_logger, clean_env):
-    """Test that resolve handles case-insensitive values in the environment variable."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ[EnvVars.PROCESSOR_MODE] = "ASYNC"
-    assert ProcessorMode.resolve() == ProcessorMode.ASYNC
-
-
-@patch("lambda_otel_lite.logger.create_logger")
-def test_resolve_with_custom_env_var(mock_create_logger, clean_env):
+def test_resolve_with_custom_env_var(monkeypatch):
     """Test that resolve handles a custom environment variable name."""
-    mock_logger = MagicMock()
-    mock_create_logger.return_value = mock_logger
-
-    os.environ["CUSTOM_ENV_VAR"] = "async"
+    monkeypatch.setenv("CUSTOM_ENV_VAR", "async")
     assert (
         ProcessorMode.resolve(ProcessorMode.SYNC, "CUSTOM_ENV_VAR")
         == ProcessorMode.ASYNC
@@ -1,7 +1,8 @@
 """Tests for the propagation module."""
 
 import os
-from typing import Dict, Iterator, List, Optional, Set
+from collections.abc import KeysView
+from typing import Dict, Iterator, Set
 
 import pytest
 from unittest.mock import MagicMock, patch
@@ -24,15 +25,15 @@ from lambda_otel_lite.propagation import (
 class ConcreteTextMapGetter:
     """Concrete implementation of TextMapGetter for testing."""
 
-    def get(self, carrier: Dict[str, str], key: str) -> Optional[List[str]]:
+    def get(self, carrier: Dict[str, str], key: str) -> tuple[str] | None:
         """Get a value from the carrier."""
         if value := carrier.get(key):
-            return [value]
+            return (value,)
         return None
 
-    def keys(self, carrier: Dict[str, str]) -> List[str]:
+    def keys(self, carrier: Dict[str, str]) -> KeysView[str]:
         """Get all keys from the carrier."""
-        return list(carrier.keys())
+        return carrier.keys()
 
 
 # Mock the AwsXRayLambdaPropagator
@@ -41,10 +42,15 @@ class MockAwsXRayLambdaPropagator:
 
     def __init__(self) -> None:
         """Initialize the mock propagator."""
-        self.extract = MagicMock(return_value=Context())
-        self.inject = MagicMock()
         self._fields = ["x-amzn-trace-id"]
 
+    def extract(self, *args: object, **kwargs: object) -> Context:
+        """Extract (always returns an empty context)."""
+        return Context()
+
+    def inject(self, *args: object, **kwargs: object) -> None:
+        """Inject (no-op)."""
+
     @property
     def fields(self) -> Set[str]:
         """Get fields."""
@@ -56,10 +62,15 @@ class MockTraceContextTextMapPropagator:
 
     def __init__(self) -> None:
         """Initialize the mock propagator."""
-        self.extract = MagicMock(return_value=Context())
-        self.inject = MagicMock()
         self._fields = ["traceparent", "tracestate"]
 
+    def extract(self, *args: object, **kwargs: object) -> Context:
+        """Extract (always returns an empty context)."""
+        return Context()
+
+    def inject(self, *args: object, **kwargs: object) -> None:
+        """Inject (no-op)."""
+
     @property
     def fields(self) -> Set[str]:
         """Get fields."""
@@ -77,6 +88,18 @@ def clean_env() -> Iterator[None]:
     yield
 
 
+@pytest.fixture(scope="module")
+def empty_ctx() -> Context:
+    """Fixture providing an empty context shared by the module's tests."""
+    return Context()
+
+
+@pytest.fixture(scope="module")
+def getter() -> ConcreteTextMapGetter:
+    """Fixture providing a text map getter shared by the module's tests."""
+    return ConcreteTextMapGetter()
+
+
 @pytest.fixture
 def mock_propagators() -> Iterator[MagicMock]:
     """Fixture to mock propagator classes."""
@@ -102,49 +125,62 @@ def mock_propagators() -> Iterator[MagicMock]:
         yield mock_logger
 
 
-def test_has_valid_span() -> None:
+class StubSpanContext:
+    """Minimal span context exposing only the ids has_valid_span reads."""
+
+    __slots__ = ("trace_id", "span_id")
+
+    def __init__(self, trace_id: str | None, span_id: str | None) -> None:
+        """Initialize the stub span context."""
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+
+class StubSpan:
+    """Minimal span returning a fixed span context."""
+
+    __slots__ = ("_span_context",)
+
+    def __init__(self, span_context: StubSpanContext | None) -> None:
+        """Initialize the stub span."""
+        self._span_context = span_context
+
+    def get_span_context(self) -> StubSpanContext | None:
+        """Get the span context."""
+        return self._span_context
+
+
+HAS_VALID_SPAN_CASES = [
+    # No span
+    (None, False),
+    # Span with no context
+    (StubSpan(None), False),
+    # Span with valid context
+    (StubSpan(StubSpanContext("trace_id", "span_id")), True),
+    # Span with invalid context (no trace_id)
+    (StubSpan(StubSpanContext(None, "span_id")), False),
+    # Span with invalid context (no span_id)
+    (StubSpan(StubSpanContext("trace_id", None)), False),
+]
+
+
+@pytest.mark.parametrize(
+    "span, expected",
+    HAS_VALID_SPAN_CASES,
+    ids=["no-span", "no-context", "valid", "no-trace-id", "no-span-id"],
+)
+def test_has_valid_span(
+    monkeypatch: pytest.MonkeyPatch, span: StubSpan | None, expected: bool
+) -> None:
     """Test the has_valid_span function."""
-    # Mock the get_current_span function
-    with patch(
-        "lambda_otel_lite.propagation.get_current_span"
-    ) as mock_get_current_span:
-        # Case 1: No span
-        mock_get_current_span.return_value = None
-        assert has_valid_span(Context()) is False
-
-        # Case 2: Span with no context
-        mock_span = MagicMock()
-        mock_span.get_span_context.return_value = None
-        mock_get_current_span.return_value = mock_span
-        assert has_valid_span(Context()) is False
-
-        # Case 3: Span with valid context
-        mock_span_context = MagicMock()
-        mock_span_context.trace_id = "trace_id"
-        mock_span_context.span_id = "span_id"
-        mock_span.get_span_context.return_value = mock_span_context
-        mock_get_current_span.return_value = mock_span
-        assert has_valid_span(Context()) is True
-
-        # Case 4: Span with invalid context (no trace_id)
-        mock_span_context = MagicMock()
-        mock_span_context.trace_id = None
-        mock_span_context.span_id = "span_id"
-        mock_span.get_span_context.return_value = mock_span_context
-        mock_get_current_span.return_value = mock_span
-        assert has_valid_span(Context()) is False
-
-        # Case 5: Span with invalid context (no span_id)
-        mock_span_context = MagicMock()
-        mock_span_context.trace_id = "trace_id"
-        mock_span_context.span_id = None
-        mock_span.get_span_context.return_value = mock_span_context
-        mock_get_current_span.return_value = mock_span
-        assert has_valid_span(Context()) is False
+    monkeypatch.setattr("lambda_otel_lite.propagation.get_current_span", lambda _: span)
+    assert has_valid_span(Context()) is expected
 
 
 def test_lambda_xray_propagator_extract_from_carrier(
     mock_propagators: MagicMock,
+    empty_ctx: Context,
+    getter: ConcreteTextMapGetter,
 ) -> None:
     """Test that LambdaXRayPropagator extracts context from carrier."""
     # Create propagator instance
@@ -154,15 +190,13 @@ def test_lambda_xray_propagator_extract_from_carrier(
     carrier: Dict[str, str] = {
         "x-amzn-trace-id": "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=53995c3f42cd8ad8;Sampled=1"
     }
-    getter = ConcreteTextMapGetter()
-    ctx = Context()
 
     # Mock has_valid_span to return True
     with patch("lambda_otel_lite.propagation.has_valid_span") as mock_has_valid_span:
         mock_has_valid_span.return_value = True
 
         # Call the method under test
-        result = propagator.extract(carrier, ctx, getter)
+        result = propagator.extract(carrier, empty_ctx, getter)
 
         # When inheriting from AwsXRayLambdaPropagator, the super().extract method is called
         # which is the extract method of the mocked base class
@@ -170,7 +204,10 @@ def test_lambda_xray_propagator_extract_from_carrier(
 
 
 def test_lambda_xray_propagator_extract_from_env_var(
-    mock_propagators: MagicMock, clean_env: None
+    mock_propagators: MagicMock,
+    clean_env: None,
+    empty_ctx: Context,
+    getter: ConcreteTextMapGetter,
 ) -> None:
     """Test that LambdaXRayPropagator extracts context from environment variable."""
     # Create propagator instance
@@ -178,12 +215,15 @@ def test_lambda_xray_propagator_extract_from_env_var(
 
     # Setup test data
     carrier: Dict[str, str] = {}
-    getter = ConcreteTextMapGetter()
-    ctx = Context()
 
-    # Mock has_valid_span to return False then True
+    # has_valid_span returns False for the carrier, then True for the env var
+    results = iter((False, True))
+
+    def has_valid_span_results(ctx: Context) -> bool:
+        return next(results)
+
     with patch("lambda_otel_lite.propagation.has_valid_span") as mock_has_valid_span:
-        mock_has_valid_span.side_effect = [False, True]
+        mock_has_valid_span.side_effect = has_valid_span_results
 
         # Set the environment variable
         os.environ["_X_AMZN_TRACE_ID"] = (
@@ -191,7 +231,7 @@ def test_lambda_xray_propagator_extract_from_env_var(
         )
 
         # Call the method under test
-        result = propagator.extract(carrier, ctx, getter)
+        result = propagator.extract(carrier, empty_ctx, getter)
 
         # Verify that a span was extracted from the env var
         from opentelemetry.trace import get_current_span
@@ -204,7 +244,9 @@ def test_lambda_xray_propagator_extract_from_env_var(
         assert span_context.is_remote
 
 
-def test_lambda_xray_propagator_inject(mock_propagators: MagicMock) -> None:
+def test_lambda_xray_propagator_inject(
+    mock_propagators: MagicMock, empty_ctx: Context
+) -> None:
     """Test that LambdaXRayPropagator injects context into carrier."""
     # Create propagator instance
     propagator = LambdaXRayPropagator()
@@ -212,10 +254,9 @@ def test_lambda_xray_propagator_inject(mock_propagators: MagicMock) -> None:
     # Setup test data
     carrier: Dict[str, str] = {}
     setter = MagicMock(spec=Setter)
-    ctx = Context()
 
     # Call the method under test
-    propagator.inject(carrier, ctx, setter)
+    propagator.inject(carrier, empty_ctx, setter)
 
 
 def test_lambda_xray_propagator_fields(mock_propagators: MagicMock) -> None:
@@ -230,72 +271,66 @@ def test_lambda_xray_propagator_fields(mock_propagators: MagicMock) -> None:
     assert isinstance(result, set)
 
 
-def test_create_propagator_with_env_var(
-    mock_propagators: MagicMock, clean_env: None
-) -> None:
-    """Test that create_propagator creates a propagator based on environment variable."""
-    # Set environment variable
-    os.environ[EnvVars.OTEL_PROPAGATORS] = "tracecontext,xray"
-
-    # Call the method under test
-    result = create_propagator()
-
-    # Verify result
-    assert isinstance(result, CompositePropagator)
-    assert len(result._propagators) == 2  # pylint: disable=protected-access
-
-
-def test_create_propagator_with_xray_lambda(
-    mock_propagators: MagicMock, clean_env: None
+CREATE_PROPAGATOR_CASES = [
+    (
+        "tracecontext,xray",
+        CompositePropagator,
+        (MockTraceContextTextMapPropagator, LambdaXRayPropagator),
+    ),
+    # xray-lambda creates a LambdaXRayPropagator
+    ("xray-lambda", CompositePropagator, (LambdaXRayPropagator,)),
+    # none creates a NoopPropagator
+    ("none", NoopPropagator, None),
+    # Default propagators when the environment variable is not set
+    (
+        None,
+        CompositePropagator,
+        (MockTraceContextTextMapPropagator, LambdaXRayPropagator),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_type, expected_members",
+    CREATE_PROPAGATOR_CASES,
+    ids=["tracecontext,xray", "xray-lambda", "none", "default"],
+)
+def test_create_propagator(
+    mock_propagators: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str | None,
+    expected_type: type,
+    expected_members: tuple[type, ...] | None,
 ) -> None:
-    """Test that create_propagator creates LambdaXRayPropagator when xray-lambda is specified."""
-    # Set environment variable
-    os.environ[EnvVars.OTEL_PROPAGATORS] = "xray-lambda"
+    """Test that create_propagator builds propagators from the environment variable."""
+    if env_value is None:
+        monkeypatch.delenv(EnvVars.OTEL_PROPAGATORS, raising=False)
+    else:
+        monkeypatch.setenv(EnvVars.OTEL_PROPAGATORS, env_value)
 
     # Call the method under test
     result = create_propagator()
 
     # Verify result
-    assert isinstance(result, CompositePropagator)
-    assert len(result._propagators) == 1  # pylint: disable=protected-access
-    assert isinstance(result._propagators[0], LambdaXRayPropagator)  # pylint: disable=protected-access
+    assert isinstance(result, expected_type)
+    if expected_members is not None:
+        members = result._propagators  # pylint: disable=protected-access
+        for member, member_type in zip(members, expected_members, strict=True):
+            assert isinstance(member, member_type)
 
 
-def test_create_propagator_with_none(
-    mock_propagators: MagicMock, clean_env: None
+def test_setup_propagator(
+    mock_propagators: MagicMock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that create_propagator creates NoopPropagator when none is specified."""
-    # Set environment variable
-    os.environ[EnvVars.OTEL_PROPAGATORS] = "none"
-
-    # Call the method under test
-    result = create_propagator()
-
-    # Verify result
-    assert isinstance(result, NoopPropagator)
-
+    """Test that setup_propagator sets the global propagator."""
+    calls = []
+    monkeypatch.setattr(
+        "lambda_otel_lite.propagation.set_global_textmap",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
 
-def test_create_propagator_with_default(
-    mock_propagators: MagicMock, clean_env: None
-) -> None:
-    """Test that create_propagator uses default propagators when environment variable is not set."""
     # Call the method under test
-    result = create_propagator()
-
-    # Verify result
-    assert isinstance(result, CompositePropagator)
-    assert len(result._propagators) == 2  # pylint: disable=protected-access
-    assert isinstance(result._propagators[0], MockTraceContextTextMapPropagator)  # pylint: disable=protected-access
-    assert isinstance(result._propagators[1], LambdaXRayPropagator)  # pylint: disable=protected-access
-
-
-def test_setup_propagator(mock_propagators: MagicMock) -> None:
-    """Test that setup_propagator sets the global propagator."""
-    with patch(
-        "lambda_otel_lite.propagation.set_global_textmap"
-    ) as mock_set_global_textmap:
-        # Call the method under test
-        setup_propagator()
+    setup_propagator()
 
-        # Verify that set_global_textmap was called
-        mock_set_global_textmap.assert_called_once()
+    # Verify that set_global_textmap was called
+    assert len(calls) == 1
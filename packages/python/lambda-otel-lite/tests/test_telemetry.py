@@ -2,11 +2,11 @@
 
 import os
 import re
+import time
 from unittest.mock import patch
 
 import pytest
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import IdGenerator
 
 from lambda_otel_lite.telemetry import (
     TelemetryCompletionHandler,
@@ -14,114 +14,139 @@ from lambda_otel_lite.telemetry import (
     init_telemetry,
 )
 
+# Eight lowercase hex characters, the X-Ray trace ID timestamp prefix
+_HEX8 = re.compile(r"^[0-9a-f]{8}$")
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
 def mock_env():
     """Fixture to provide a clean environment for each test."""
     from opentelemetry import trace
-    from opentelemetry.util._once import Once
 
     # Clear any existing tracer provider
     trace._TRACER_PROVIDER = None
-    trace._TRACER_PROVIDER_SET_ONCE = Once()
+    # Rearm the existing Once rather than building a new one for every test
+    once = trace._TRACER_PROVIDER_SET_ONCE
+    if hasattr(once, "_done"):
+        once._done = False
+    else:
+        from opentelemetry.util._once import Once
+
+        trace._TRACER_PROVIDER_SET_ONCE = Once()
     with patch.dict(os.environ, {}, clear=True):
         yield
 
 
-def test_get_lambda_resource_basic(mock_env):
-    """Test basic Lambda resource creation with minimal environment."""
-    os.environ.update(
-        {
-            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
-            "AWS_REGION": "us-west-2",
-        }
-    )
-
-    resource = get_lambda_resource()
-    assert isinstance(resource, Resource)
-    attrs = resource.attributes
-
-    assert attrs["service.name"] == "test-function"
-    assert attrs["faas.name"] == "test-function"
-    assert attrs["cloud.provider"] == "aws"
-    assert attrs["cloud.region"] == "us-west-2"
-
-
-def test_get_lambda_resource_with_otel_service_name(mock_env):
-    """Test that OTEL_SERVICE_NAME overrides AWS_LAMBDA_FUNCTION_NAME for service.name."""
-    os.environ.update(
+GET_LAMBDA_RESOURCE_CASES = [
+    # Minimal environment
+    (
+        {"AWS_LAMBDA_FUNCTION_NAME": "test-function", "AWS_REGION": "us-west-2"},
         {
-            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
-            "OTEL_SERVICE_NAME": "custom-service",
-        }
-    )
-
-    resource = get_lambda_resource()
-    assert resource.attributes["service.name"] == "custom-service"
-    assert resource.attributes["faas.name"] == "test-function"
-
-
-def test_get_lambda_resource_with_resource_attributes(mock_env):
-    """Test that OTEL_RESOURCE_ATTRIBUTES are properly parsed."""
-    os.environ.update(
+            "service.name": "test-function",
+            "faas.name": "test-function",
+            "cloud.provider": "aws",
+            "cloud.region": "us-west-2",
+        },
+        (),
+    ),
+    # OTEL_SERVICE_NAME overrides AWS_LAMBDA_FUNCTION_NAME for service.name
+    (
+        {"AWS_LAMBDA_FUNCTION_NAME": "test-function", "OTEL_SERVICE_NAME": "custom-service"},
+        {"service.name": "custom-service", "faas.name": "test-function"},
+        (),
+    ),
+    # OTEL_RESOURCE_ATTRIBUTES are parsed, Lambda attributes remain unchanged
+    (
         {
             "AWS_LAMBDA_FUNCTION_NAME": "test-function",
             "OTEL_RESOURCE_ATTRIBUTES": "key1=value1,key2=value2,custom.provider=gcp",
-        }
-    )
-
-    resource = get_lambda_resource()
-    attrs = resource.attributes
-
-    assert attrs["key1"] == "value1"
-    assert attrs["key2"] == "value2"
-    assert attrs["custom.provider"] == "gcp"
-    # Lambda attributes should remain unchanged
-    assert attrs["cloud.provider"] == "aws"
-
-
-def test_get_lambda_resource_with_url_encoded_attributes(mock_env):
-    """Test that URL-encoded values in OTEL_RESOURCE_ATTRIBUTES are properly decoded."""
-    os.environ.update(
+        },
+        {"key1": "value1", "key2": "value2", "custom.provider": "gcp", "cloud.provider": "aws"},
+        (),
+    ),
+    # URL-encoded values in OTEL_RESOURCE_ATTRIBUTES are decoded
+    (
         {
             "AWS_LAMBDA_FUNCTION_NAME": "test-function",
             "OTEL_RESOURCE_ATTRIBUTES": "deployment.env=prod%20env,custom.name=my%20service",
-        }
-    )
-
-    resource = get_lambda_resource()
-    attrs = resource.attributes
-
-    assert attrs["deployment.env"] == "prod env"
-    assert attrs["custom.name"] == "my service"
-    assert attrs["service.name"] == "test-function"
-
-
-def test_get_lambda_resource_no_service_name(mock_env):
-    """Test that service.name defaults to 'unknown_service' when no name is provided."""
-    resource = get_lambda_resource()
-    attrs = resource.attributes
-
-    assert attrs["service.name"] == "unknown_service"
-    assert "faas.name" not in attrs
-    assert attrs["cloud.provider"] == "aws"
-
-
-def test_get_lambda_resource_only_otel_service_name(mock_env):
-    """Test that when only OTEL_SERVICE_NAME is set, faas.name is not set."""
-    os.environ["OTEL_SERVICE_NAME"] = "custom-service"
+        },
+        {
+            "deployment.env": "prod env",
+            "custom.name": "my service",
+            "service.name": "test-function",
+        },
+        (),
+    ),
+    # service.name defaults to 'unknown_service' when no name is provided
+    (
+        {},
+        {"service.name": "unknown_service", "cloud.provider": "aws"},
+        ("faas.name",),
+    ),
+    # faas.name is not set when only OTEL_SERVICE_NAME is set
+    (
+        {"OTEL_SERVICE_NAME": "custom-service"},
+        {"service.name": "custom-service", "cloud.provider": "aws"},
+        ("faas.name",),
+    ),
+    # All supported variables
+    (
+        {
+            "AWS_REGION": "us-west-2",
+            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
+            "AWS_LAMBDA_FUNCTION_VERSION": "$LATEST",
+            "AWS_LAMBDA_LOG_STREAM_NAME": "2024/02/16/[$LATEST]1234567890",
+            "AWS_LAMBDA_FUNCTION_MEMORY_SIZE": "128",
+            "OTEL_SERVICE_NAME": "custom-service",
+            "OTEL_RESOURCE_ATTRIBUTES": "team=platform,env=dev",
+        },
+        {
+            "cloud.provider": "aws",
+            "cloud.region": "us-west-2",
+            "faas.name": "test-function",
+            "faas.version": "$LATEST",
+            "faas.instance": "2024/02/16/[$LATEST]1234567890",
+            # 128 MB = 128 * 1024 * 1024 bytes
+            "faas.max_memory": 128 * 1024 * 1024,
+            "service.name": "custom-service",
+            "team": "platform",
+            "env": "dev",
+        },
+        (),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "env, expected, absent",
+    GET_LAMBDA_RESOURCE_CASES,
+    ids=[
+        "minimal",
+        "otel-service-name",
+        "resource-attributes",
+        "url-encoded-attributes",
+        "no-service-name",
+        "only-otel-service-name",
+        "all-attributes",
+    ],
+)
+def test_get_lambda_resource(monkeypatch, env, expected, absent):
+    """Test that get_lambda_resource builds the expected attributes from the environment."""
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
 
     resource = get_lambda_resource()
+    assert isinstance(resource, Resource)
     attrs = resource.attributes
 
-    assert attrs["service.name"] == "custom-service"
-    assert "faas.name" not in attrs
-    assert attrs["cloud.provider"] == "aws"
+    assert expected.items() <= attrs.items()
+    for name in absent:
+        assert name not in attrs
 
 
-def test_init_telemetry_basic(mock_env):
+def test_init_telemetry_basic(monkeypatch):
     """Test basic telemetry initialization."""
-    os.environ["AWS_LAMBDA_FUNCTION_NAME"] = "test-function"
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test-function")
 
     tracer, handler = init_telemetry()
 
@@ -130,7 +155,7 @@ def test_init_telemetry_basic(mock_env):
     assert isinstance(handler, TelemetryCompletionHandler)
 
 
-def test_init_telemetry_with_custom_resource(mock_env):
+def test_init_telemetry_with_custom_resource():
     """Test telemetry initialization with a custom resource."""
     custom_resource = Resource.create({"custom.attr": "value"})
 
@@ -139,7 +164,7 @@ def test_init_telemetry_with_custom_resource(mock_env):
     assert handler.tracer_provider.resource.attributes["custom.attr"] == "value"
 
 
-def test_init_telemetry_with_custom_processor(mock_env):
+def test_init_telemetry_with_custom_processor():
     """Test telemetry initialization with a custom processor."""
     from opentelemetry.sdk.trace import SpanProcessor
 
@@ -169,23 +194,23 @@ def test_init_telemetry_with_custom_processor(mock_env):
     assert custom_processor.was_used
 
 
-def test_init_telemetry_with_custom_id_generator(mock_env):
+def test_init_telemetry_with_custom_id_generator():
     """Test telemetry initialization with a custom ID generator."""
+    from opentelemetry.sdk.trace import IdGenerator
 
     class MockXRayIdGenerator(IdGenerator):
         def __init__(self):
             self.trace_id_called = False
             self.span_id_called = False
+            # X-Ray format: <timestamp in seconds>-<random part>
+            # The test only checks the prefix shape, so the timestamp is taken once
+            self.timestamp_hex = f"{int(time.time()):08x}"
 
         def generate_trace_id(self):
             self.trace_id_called = True
             # Return a trace ID with a timestamp in the first 32 bits (8 hex chars)
-            # X-Ray format: <timestamp in seconds>-<random part>
-            import time
-
-            timestamp_hex = format(int(time.time()), "08x")
             random_part = "a" * 24  # Use a fixed value to easily verify it
-            return int(timestamp_hex + random_part, 16)
+            return int(self.timestamp_hex + random_part, 16)
 
         def generate_span_id(self):
             self.span_id_called = True
@@ -212,7 +237,7 @@ def test_init_telemetry_with_custom_id_generator(mock_env):
 
     # The first 8 chars should be a valid timestamp (in the last day)
     timestamp_chars = trace_id_hex[:8]
-    assert re.match(r"^[0-9a-f]{8}$", timestamp_chars) is not None
+    assert _HEX8.match(timestamp_chars) is not None
 
     # The rest should match our fixed random part
     random_part = trace_id_hex[8:]
@@ -225,112 +250,54 @@ def test_init_telemetry_with_custom_id_generator(mock_env):
     span.end()
 
 
-def test_get_lambda_resource_with_all_attributes(mock_env):
-    """Test that get_lambda_resource sets all expected attributes."""
-    os.environ.update(
+def test_get_lambda_resource_with_custom_resource(monkeypatch):
+    """Test that get_lambda_resource merges with custom resource."""
+    custom_resource = Resource.create(
         {
-            "AWS_REGION": "us-west-2",
-            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
-            "AWS_LAMBDA_FUNCTION_VERSION": "$LATEST",
-            "AWS_LAMBDA_LOG_STREAM_NAME": "2024/02/16/[$LATEST]1234567890",
-            "AWS_LAMBDA_FUNCTION_MEMORY_SIZE": "128",
-            "OTEL_SERVICE_NAME": "custom-service",
-            "OTEL_RESOURCE_ATTRIBUTES": "team=platform,env=dev",
+            "custom.attribute": "value",
+            "service.name": "override-service",
         }
     )
 
-    resource = get_lambda_resource()
+    monkeypatch.setenv("AWS_REGION", "us-west-2")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test-function")
+    monkeypatch.setenv("OTEL_SERVICE_NAME", "env-service")
+    resource = get_lambda_resource(custom_resource)
     attributes = resource.attributes
 
-    # Test cloud and FAAS attributes
+    # Custom attributes should be preserved
+    assert attributes["custom.attribute"] == "value"
+    # Service name from custom resource should take precedence
+    assert attributes["service.name"] == "override-service"
+    # Lambda attributes should still be present
     assert attributes["cloud.provider"] == "aws"
     assert attributes["cloud.region"] == "us-west-2"
     assert attributes["faas.name"] == "test-function"
-    assert attributes["faas.version"] == "$LATEST"
-    assert attributes["faas.instance"] == "2024/02/16/[$LATEST]1234567890"
-    # 128 MB = 128 * 1024 * 1024 bytes
-    assert attributes["faas.max_memory"] == 128 * 1024 * 1024
-
-    # Test service name
-    assert attributes["service.name"] == "custom-service"
 
-    # Test custom attributes
-    assert attributes["team"] == "platform"
-    assert attributes["env"] == "dev"
 
-
-def test_get_lambda_resource_defaults(mock_env):
-    """Test that get_lambda_resource uses defaults when env vars are missing."""
+def test_get_lambda_resource_with_malformed_attributes(monkeypatch):
+    """Test that get_lambda_resource handles malformed OTEL_RESOURCE_ATTRIBUTES."""
+    monkeypatch.setenv("OTEL_RESOURCE_ATTRIBUTES", "invalid,key=value,another=invalid=format")
     resource = get_lambda_resource()
     attributes = resource.attributes
 
-    assert "cloud.provider" in attributes
-    assert attributes["cloud.provider"] == "aws"
-    assert attributes["service.name"] == "unknown_service"
-
-
-def test_get_lambda_resource_with_custom_resource(mock_env):
-    """Test that get_lambda_resource merges with custom resource."""
-    custom_resource = Resource.create(
-        {
-            "custom.attribute": "value",
-            "service.name": "override-service",
-        }
-    )
+    # Should only parse valid key=value pairs
+    assert attributes["key"] == "value"
+    # The SDK accepts values containing equals signs
+    assert attributes["another"] == "invalid=format"
+    # But completely malformed entries (no equals) are skipped
+    assert "invalid" not in attributes
 
-    with patch.dict(
-        os.environ,
-        {
-            "AWS_REGION": "us-west-2",
-            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
-            "OTEL_SERVICE_NAME": "env-service",
-        },
-    ):
-        resource = get_lambda_resource(custom_resource)
-        attributes = resource.attributes
-
-        # Custom attributes should be preserved
-        assert attributes["custom.attribute"] == "value"
-        # Service name from custom resource should take precedence
-        assert attributes["service.name"] == "override-service"
-        # Lambda attributes should still be present
-        assert attributes["cloud.provider"] == "aws"
-        assert attributes["cloud.region"] == "us-west-2"
-        assert attributes["faas.name"] == "test-function"
 
-
-def test_get_lambda_resource_with_malformed_attributes(mock_env):
-    """Test that get_lambda_resource handles malformed OTEL_RESOURCE_ATTRIBUTES."""
-    with patch.dict(
-        os.environ,
-        {
-            "OTEL_RESOURCE_ATTRIBUTES": "invalid,key=value,another=invalid=format",
-        },
-    ):
-        resource = get_lambda_resource()
-        attributes = resource.attributes
-
-        # Should only parse valid key=value pairs
-        assert attributes["key"] == "value"
-        # The SDK accepts values containing equals signs
-        assert attributes["another"] == "invalid=format"
-        # But completely malformed entries (no equals) are skipped
-        assert "invalid" not in attributes
-
-
-def test_init_telemetry_resource_attributes(mock_env):
+def test_init_telemetry_resource_attributes(monkeypatch):
     """Test that init_telemetry correctly sets up resource attributes."""
-    os.environ.update(
-        {
-            "AWS_REGION": "us-west-2",
-            "AWS_LAMBDA_FUNCTION_NAME": "test-function",
-            "AWS_LAMBDA_FUNCTION_VERSION": "$LATEST",
-            "AWS_LAMBDA_LOG_STREAM_NAME": "2024/02/16/[$LATEST]1234567890",
-            "AWS_LAMBDA_FUNCTION_MEMORY_SIZE": "128",
-            "OTEL_SERVICE_NAME": "custom-service",
-            "OTEL_RESOURCE_ATTRIBUTES": "team=platform,env=dev",
-        }
-    )
+    monkeypatch.setenv("AWS_REGION", "us-west-2")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test-function")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_VERSION", "$LATEST")
+    monkeypatch.setenv("AWS_LAMBDA_LOG_STREAM_NAME", "2024/02/16/[$LATEST]1234567890")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", "128")
+    monkeypatch.setenv("OTEL_SERVICE_NAME", "custom-service")
+    monkeypatch.setenv("OTEL_RESOURCE_ATTRIBUTES", "team=platform,env=dev")
 
     tracer, handler = init_telemetry()
     attrs = handler.tracer_provider.resource.attributes
@@ -343,7 +310,7 @@ def test_init_telemetry_resource_attributes(mock_env):
     assert attrs["env"] == "dev"
 
 
-def test_init_telemetry_with_custom_propagators(mock_env):
+def test_init_telemetry_with_custom_propagators():
     """Test telemetry initialization with custom propagators."""
     from opentelemetry.propagate import get_global_textmap
     from opentelemetry.propagators.composite import CompositePropagator